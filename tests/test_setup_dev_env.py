@@ -0,0 +1,291 @@
+"""
+Tests for the development environment setup script
+
+These tests cover the parts of setup_dev_env.py that decide how much work a
+setup run does:
+
+- Setup stamp fingerprinting and the install skip path
+- Import probing through a single interpreter start
+- Installer fallbacks (legacy pandas constraint, source build prompt)
+- Skip-write helpers used for setup.py and .env
+- Virtual environment removal
+
+Key Test Patterns:
+- run_command and probe_imports are replaced, so no pip or network calls run
+- Files are created under tmp_path and the working directory is switched to it
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import setup_dev_env
+
+
+@pytest.fixture
+def venv_python(tmp_path, monkeypatch) -> str:
+    """Fake virtual environment interpreter, with the working directory set to tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "requirements-dev.txt").write_text("pytest\n")
+    python = tmp_path / "venv" / "bin" / "python"
+    python.parent.mkdir(parents=True)
+    python.write_text("")
+    return str(python)
+
+
+@pytest.fixture
+def fake_pip(monkeypatch):
+    """Record every command instead of running it; commands containing a string in `failing` fail"""
+    class FakePip:
+        def __init__(self):
+            self.calls = []
+            self.failing = []
+            self.missing_modules = []
+
+        def run_command(self, argv, check=True, capture_output=False, env=None):
+            self.calls.append(argv)
+            if any(marker in argv for marker in self.failing):
+                return "ERROR"
+            return None
+
+        def probe_imports(self, venv_python, modules):
+            return {name: None if name in self.missing_modules else "1.0" for name in modules}
+
+    pip = FakePip()
+    monkeypatch.setattr(setup_dev_env, "run_command", pip.run_command)
+    monkeypatch.setattr(setup_dev_env, "probe_imports", pip.probe_imports)
+    monkeypatch.setattr(setup_dev_env.shutil, "which", lambda name: None)
+    return pip
+
+
+def get_stamp_path(venv_python: str) -> Path:
+    return Path(venv_python).parent.parent / setup_dev_env.SETUP_STAMP_NAME
+
+
+class TestDependencyFingerprint:
+    """Test cases for get_dependency_fingerprint()"""
+
+    def test_fingerprint_is_stable(self, tmp_path, monkeypatch):
+        """Test the same inputs give the same fingerprint"""
+        monkeypatch.chdir(tmp_path)
+
+        assert (setup_dev_env.get_dependency_fingerprint(["pandas", "tqdm"]) ==
+                setup_dev_env.get_dependency_fingerprint(["pandas", "tqdm"]))
+
+    def test_fingerprint_tracks_dependency_list(self, tmp_path, monkeypatch):
+        """Test a changed dependency list changes the fingerprint"""
+        monkeypatch.chdir(tmp_path)
+
+        assert (setup_dev_env.get_dependency_fingerprint(["pandas"]) !=
+                setup_dev_env.get_dependency_fingerprint(["pandas", "tqdm"]))
+
+    def test_fingerprint_tracks_requirements_files(self, tmp_path, monkeypatch):
+        """Test edits to requirements-dev.txt or the lockfile change the fingerprint"""
+        monkeypatch.chdir(tmp_path)
+        before = setup_dev_env.get_dependency_fingerprint(["pandas"])
+
+        Path("requirements-dev.txt").write_text("pytest\n")
+        with_dev = setup_dev_env.get_dependency_fingerprint(["pandas"])
+        Path(setup_dev_env.LOCKFILE_NAME).write_text("pandas==2.0.3\n")
+        with_lock = setup_dev_env.get_dependency_fingerprint(["pandas"])
+
+        assert len({before, with_dev, with_lock}) == 3
+
+
+class TestProbeImports:
+    """Test cases for probe_imports()"""
+
+    def test_probe_parses_last_output_line(self, monkeypatch):
+        """Test the JSON result is read from the last line, after any import-time output"""
+        output = 'some warning\n{"pandas": "2.0.3", "oracledb": null}'
+        monkeypatch.setattr(setup_dev_env, "run_command", lambda *args, **kwargs: output)
+
+        versions = setup_dev_env.probe_imports("python", ["pandas", "oracledb"])
+
+        assert versions == {"pandas": "2.0.3", "oracledb": None}
+
+    @pytest.mark.parametrize("output", ["ERROR", "", "not json"])
+    def test_probe_failure_marks_all_modules_missing(self, monkeypatch, output):
+        """Test a failed interpreter start or unreadable output reports every module as missing"""
+        monkeypatch.setattr(setup_dev_env, "run_command", lambda *args, **kwargs: output)
+
+        versions = setup_dev_env.probe_imports("python", ["pandas", "seton_utils"])
+
+        assert versions == {"pandas": None, "seton_utils": None}
+
+
+class TestInstallDependencies:
+    """Test cases for the setup stamp handling in install_dependencies()"""
+
+    def test_complete_install_writes_stamp(self, venv_python, fake_pip):
+        """Test a complete install stamps the virtual environment"""
+        assert setup_dev_env.install_dependencies(venv_python, "pat") is True
+
+        assert get_stamp_path(venv_python).exists()
+        assert fake_pip.calls
+
+    def test_matching_stamp_skips_install(self, venv_python, fake_pip):
+        """Test a second run with an unchanged dependency set runs no pip commands"""
+        setup_dev_env.install_dependencies(venv_python, "pat")
+        fake_pip.calls.clear()
+
+        assert setup_dev_env.install_dependencies(venv_python, "pat") is True
+
+        assert fake_pip.calls == []
+
+    def test_stale_stamp_reinstalls(self, venv_python, fake_pip):
+        """Test a stamp from a different dependency set does not skip the install"""
+        get_stamp_path(venv_python).write_text("stale")
+
+        assert setup_dev_env.install_dependencies(venv_python, "pat") is True
+
+        assert fake_pip.calls
+        assert get_stamp_path(venv_python).read_text() != "stale"
+
+    def test_failed_probe_reinstalls(self, venv_python, fake_pip):
+        """Test a matching stamp is ignored when the installed packages no longer import"""
+        setup_dev_env.install_dependencies(venv_python, "pat")
+        fake_pip.calls.clear()
+        fake_pip.missing_modules = ["seton_utils"]
+
+        setup_dev_env.install_dependencies(venv_python, "pat")
+
+        assert fake_pip.calls
+
+    def test_partial_install_is_not_stamped(self, venv_python, fake_pip):
+        """Test a failed development dependency install leaves no stamp behind"""
+        fake_pip.failing = ["requirements-dev.txt"]
+
+        assert setup_dev_env.install_dependencies(venv_python, "pat") is True
+
+        assert not get_stamp_path(venv_python).exists()
+
+    def test_seton_utils_import_failure_continues_without_stamp(self, venv_python, fake_pip):
+        """Test a broken seton_utils install is left for validate_installation to diagnose"""
+        fake_pip.missing_modules = ["seton_utils"]
+
+        assert setup_dev_env.install_dependencies(venv_python, "pat") is True
+
+        assert not get_stamp_path(venv_python).exists()
+
+    def test_lockfile_installs_seton_utils_with_dependencies(self, venv_python, fake_pip):
+        """Test the lockfile path installs pinned packages with --no-deps but resolves seton_utils"""
+        Path(setup_dev_env.LOCKFILE_NAME).write_text("pandas==2.0.3\n")
+
+        setup_dev_env.install_dependencies(venv_python, "pat")
+
+        lock_call = next(argv for argv in fake_pip.calls if setup_dev_env.LOCKFILE_NAME in argv)
+        seton_call = next(argv for argv in fake_pip.calls if any("seton_utils.git" in arg for arg in argv))
+        assert "--no-deps" in lock_call
+        assert "--no-deps" not in seton_call
+
+
+class TestInstallResolvedDependencies:
+    """Test cases for the fallbacks in install_resolved_dependencies()"""
+
+    LEGACY_DEPS = ["pandas>=1.3.0,<2.1.0", "openpyxl"]
+
+    def test_legacy_constraint_failure_retries_modern_pandas(self, fake_pip):
+        """Test the batch is retried with unconstrained pandas when the legacy range fails"""
+        fake_pip.failing = ["pandas>=1.3.0,<2.1.0"]
+
+        assert setup_dev_env.install_resolved_dependencies(
+            "python", ["pip", "install"], self.LEGACY_DEPS, "seton_utils_url", {}) is True
+
+        assert fake_pip.calls[-1][:4] == ["pip", "install", "pandas", "openpyxl"]
+
+    def test_no_source_build_prompt_when_wheel_available(self, fake_pip, monkeypatch):
+        """Test failures unrelated to pandas wheels fail without offering a source build"""
+        fake_pip.failing = ["seton_utils_url"]
+        monkeypatch.setattr("builtins.input", lambda prompt: pytest.fail("unexpected prompt"))
+
+        assert setup_dev_env.install_resolved_dependencies(
+            "python", ["pip", "install"], self.LEGACY_DEPS, "seton_utils_url", {}) is False
+
+    def test_source_build_offered_when_wheel_missing(self, fake_pip, monkeypatch):
+        """Test the source build prompt appears when no pandas wheel is available"""
+        fake_pip.failing = ["--only-binary=pandas"]
+        monkeypatch.setattr("builtins.input", lambda prompt: "y")
+
+        assert setup_dev_env.install_resolved_dependencies(
+            "python", ["pip", "install"], self.LEGACY_DEPS, "seton_utils_url", {}) is True
+
+        assert "--no-binary=pandas" in fake_pip.calls[-1]
+
+
+class TestSkipWriteHelpers:
+    """Test cases for write_if_changed() and copy_if_changed()"""
+
+    def test_write_if_changed_keeps_unchanged_file(self, tmp_path):
+        """Test identical content is not rewritten, so the mtime is preserved"""
+        path = tmp_path / "setup.py"
+        path.write_text("content\n")
+        os.utime(path, (1_000_000, 1_000_000))
+
+        assert setup_dev_env.write_if_changed(str(path), "content\n") is False
+
+        assert path.stat().st_mtime == 1_000_000
+
+    def test_write_if_changed_writes_new_content(self, tmp_path):
+        """Test missing or different files are written"""
+        path = tmp_path / "setup.py"
+
+        assert setup_dev_env.write_if_changed(str(path), "first\n") is True
+        assert setup_dev_env.write_if_changed(str(path), "second\n") is True
+
+        assert path.read_text() == "second\n"
+
+    def test_copy_if_changed_is_byte_exact(self, tmp_path):
+        """Test the copy keeps line endings, and a second copy is skipped"""
+        src = tmp_path / ".env.example"
+        dst = tmp_path / ".env"
+        src.write_bytes(b"ENVIRONMENT=development\r\nGITHUB_PAT=x\r\n")
+
+        assert setup_dev_env.copy_if_changed(str(src), str(dst)) is True
+        assert dst.read_bytes() == src.read_bytes()
+        assert setup_dev_env.copy_if_changed(str(src), str(dst)) is False
+
+    def test_copy_if_changed_replaces_different_file(self, tmp_path):
+        """Test an existing file with other content is overwritten"""
+        src = tmp_path / ".env.example"
+        dst = tmp_path / ".env"
+        src.write_bytes(b"A=1\n")
+        dst.write_bytes(b"A=2\n")
+
+        assert setup_dev_env.copy_if_changed(str(src), str(dst)) is True
+
+        assert dst.read_bytes() == b"A=1\n"
+
+
+class TestRmtree:
+    """Test cases for fast_rmtree() and scandir_rmtree()"""
+
+    @staticmethod
+    def make_tree(root: Path) -> Path:
+        (root / "venv" / "lib" / "site-packages").mkdir(parents=True)
+        (root / "venv" / "lib" / "site-packages" / "module.py").write_text("")
+        (root / "venv" / "pyvenv.cfg").write_text("")
+        return root / "venv"
+
+    def test_scandir_rmtree_removes_nested_tree(self, tmp_path):
+        """Test the Python-level walk removes files and nested directories"""
+        tree = self.make_tree(tmp_path)
+
+        setup_dev_env.scandir_rmtree(str(tree))
+
+        assert not tree.exists()
+
+    def test_fast_rmtree_falls_back_when_native_tool_missing(self, tmp_path, monkeypatch):
+        """Test the tree is still removed when rm/rd cannot be run"""
+        tree = self.make_tree(tmp_path)
+
+        def missing_tool(*args, **kwargs):
+            raise OSError("not found")
+
+        monkeypatch.setattr(setup_dev_env.subprocess, "run", missing_tool)
+
+        setup_dev_env.fast_rmtree(str(tree))
+
+        assert not tree.exists()